@@ -1,57 +1,67 @@
 import great_expectations as gx
+import great_expectations.expectations as gxe
+from _context import get as get_context
+from _setup import get_or_build as get_or_build_setup, update_suite
 import pandas as pd
 from great_expectations.data_context.types.resource_identifiers import ValidationResultIdentifier, ExpectationSuiteIdentifier
 from great_expectations.core.run_identifier import RunIdentifier
 import datetime
+import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+# GX objects this script validates against; main.py creates them up front
+DATASOURCE_NAME = "my_pandas_datasource"
+ASSET_NAME = "my_df_asset"
+BATCH_DEFINITION_NAME = "my_batch_def"
+SUITE_NAME = "my_hello_world_suite"
+
+# Single background writer for validation results, so the JSON dump and disk
+# write happen off the validation path; pending writes are flushed at exit
+_STORE_WRITER = ThreadPoolExecutor(max_workers=1)
+atexit.register(_STORE_WRITER.shutdown)
+
+def _report_store_error(future):
+    if future.exception() is not None:
+        print(f"Failed to store validation result: {future.exception()}")
+
+# Sample DataFrame, built on first use and reused by later hello_world() calls
+_SAMPLE_DF = None
+
+def _get_sample_df():
+    global _SAMPLE_DF
+    if _SAMPLE_DF is None:
+        data = {
+            "name": ["Alice", "Bob", "Charlie"],
+            "age": [25, 30, 35]
+        }
+        _SAMPLE_DF = pd.DataFrame(data)
+    return _SAMPLE_DF
 
 def hello_world():
     print("Starting Hello World GX...")
-    context = gx.get_context(mode="file")
-    
-    data = {
-        "name": ["Alice", "Bob", "Charlie"],
-        "age": [25, 30, 35]
-    }
-    df = pd.DataFrame(data)
+    context = get_context()
     
-    # Get or create datasource
-    try:
-        datasource = context.data_sources.get("my_pandas_datasource")
-        print("Using existing datasource")
-    except (KeyError, AttributeError):
-        try:
-            datasource = context.data_sources.add_pandas("my_pandas_datasource")
-            print("Created new datasource")
-        except AttributeError:
-            datasource = context.sources.add_pandas("my_pandas_datasource")
-    
-    # Get or create asset
-    try:
-        asset = datasource.get_asset("my_df_asset")
-        print("Using existing asset")
-    except (KeyError, LookupError):
-        batch = datasource.read_dataframe(df, asset_name="my_df_asset")
-        print("Created new asset")
-        asset = datasource.get_asset("my_df_asset")
+    batch_def, suite = get_or_build_setup(
+        context, DATASOURCE_NAME, ASSET_NAME, BATCH_DEFINITION_NAME, SUITE_NAME
+    )
     
-    # Get or create batch definition
-    try:
-        batch_def = asset.get_batch_definition("my_batch_def")
-        print("Using existing batch definition")
-    except (KeyError, LookupError):
-        batch_def = asset.add_batch_definition_whole_dataframe("my_batch_def")
-        print("Created new batch definition")
+    # Populate an empty suite with a single store write
+    if len(suite.expectations) == 0:
+        print("Adding expectations to new suite...")
+        suite = context.suites.add_or_update(gx.ExpectationSuite(
+            name=suite.name,
+            expectations=[
+                gxe.ExpectColumnValuesToNotBeNull(column="name"),
+                gxe.ExpectColumnValuesToBeBetween(column="age", min_value=20, max_value=40)
+            ]
+        ))
+        update_suite(ASSET_NAME, batch_def, suite)
+    else:
+        print(f"Suite already has {len(suite.expectations)} expectations")
     
     # Get batch from definition
-    batch = batch_def.get_batch(batch_parameters={"dataframe": df})
-    
-    # Get or create expectation suite
-    try:
-        suite = context.suites.get("my_hello_world_suite")
-        print("Using existing expectation suite")
-    except (KeyError, LookupError):
-        suite = context.suites.add(gx.ExpectationSuite(name="my_hello_world_suite"))
-        print("Created new expectation suite")
+    batch = batch_def.get_batch(batch_parameters={"dataframe": _get_sample_df()})
     
     # Create validator with existing suite
     validator = context.get_validator(
@@ -59,17 +69,25 @@ def hello_world():
         expectation_suite=suite
     )
     
-    # Only add expectations if suite is empty
-    if len(suite.expectations) == 0:
-        print("Adding expectations to new suite...")
-        validator.expect_column_values_to_not_be_null("name")
-        validator.expect_column_values_to_be_between("age", 20, 40)
-        context.suites.add_or_update(validator.expectation_suite)
+    # Per-expectation details are only needed for debugging or Data Docs
+    if os.environ.get("GX_DEBUG") == "1" or os.environ.get("GX_OPEN_DOCS") == "1":
+        result_format = "SUMMARY"
     else:
-        print(f"Suite already has {len(suite.expectations)} expectations")
+        result_format = "BOOLEAN_ONLY"
+    
+    # Build the run and result identifiers up front so the run time is taken
+    # before validation and only the store write follows it
+    run_id = RunIdentifier(run_name="my_run", run_time=datetime.datetime.now(datetime.timezone.utc))
+    suite_identifier = ExpectationSuiteIdentifier(SUITE_NAME)
+    
+    identifier = ValidationResultIdentifier(
+        expectation_suite_identifier=suite_identifier,
+        run_id=run_id,
+        batch_identifier="my_batch"
+    )
     
     print("Validating...")
-    validation_result = validator.validate()
+    validation_result = validator.validate(run_id=run_id, result_format=result_format)
     
     print("\nValidation Result Summary:")
     print(f"Success: {validation_result.success}")
@@ -79,23 +97,23 @@ def hello_world():
     else:
         print("\nFAILURE: Some expectations failed.")
         
-    print("Generating Data Docs...")
+    print("Storing validation result...")
     
-    # Manually add validation result to the store
-    run_id = RunIdentifier(run_name="my_run", run_time=datetime.datetime.now(datetime.timezone.utc))
-    suite_identifier = ExpectationSuiteIdentifier("my_hello_world_suite")
-    
-    identifier = ValidationResultIdentifier(
-        expectation_suite_identifier=suite_identifier,
-        run_id=run_id,
-        batch_identifier="my_batch"
+    # Manually add validation result to the store, in the background
+    store_write = _STORE_WRITER.submit(
+        context.validation_results_store.add, key=identifier, value=validation_result
     )
+    store_write.add_done_callback(_report_store_error)
     
-    context.validation_results_store.add(key=identifier, value=validation_result)
-    
-    print("Building and opening Data Docs...")
-    context.build_data_docs()
-    context.open_data_docs()
+    # Data Docs are opt-in and only the new result is rendered
+    if os.environ.get("GX_OPEN_DOCS") == "1":
+        # Docs are rendered from the store, so wait for the write
+        store_write.result()
+        print("Building and opening Data Docs...")
+        context.build_data_docs(resource_identifiers=[identifier])
+        context.open_data_docs(resource_identifier=identifier)
+    else:
+        print("Skipping Data Docs (set GX_OPEN_DOCS=1 to build and open them)")
 
 if __name__ == "__main__":
     hello_world()
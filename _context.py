@@ -0,0 +1,11 @@
+import great_expectations as gx
+
+# File-based Data Context shared by every script running in this process,
+# so great_expectations.yml is parsed and the stores are set up only once
+_ctx = None
+
+def get():
+    global _ctx
+    if _ctx is None:
+        _ctx = gx.get_context(mode="file")
+    return _ctx
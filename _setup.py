@@ -0,0 +1,69 @@
+import great_expectations as gx
+from great_expectations.data_context.types.resource_identifiers import ExpectationSuiteIdentifier
+
+# Batch definition and suite keyed by (suite_name, asset_name), so repeated
+# runs in the same process skip the config store lookups
+_cache = {}
+
+def get_or_build(context, datasource_name, asset_name, batch_definition_name, suite_name):
+    key = (suite_name, asset_name)
+    if key in _cache:
+        return _cache[key]
+
+    # Get or create datasource
+    if datasource_name in context.data_sources.all():
+        datasource = context.data_sources.get(datasource_name)
+        print("Using existing datasource")
+    else:
+        datasource = context.data_sources.add_pandas(datasource_name)
+        print("Created new datasource")
+
+    # Get or create asset
+    if asset_name in datasource.get_asset_names():
+        asset = datasource.get_asset(asset_name)
+        print("Using existing asset")
+    else:
+        asset = datasource.add_dataframe_asset(asset_name)
+        print("Created new asset")
+
+    # Get or create batch definition
+    if batch_definition_name in {bd.name for bd in asset.batch_definitions}:
+        batch_def = asset.get_batch_definition(batch_definition_name)
+        print("Using existing batch definition")
+    else:
+        batch_def = asset.add_batch_definition_whole_dataframe(batch_definition_name)
+        print("Created new batch definition")
+
+    # Get or create expectation suite
+    if context.expectations_store.has_key(ExpectationSuiteIdentifier(suite_name)):
+        suite = context.suites.get(suite_name)
+        print("Using existing expectation suite")
+    else:
+        suite = context.suites.add(gx.ExpectationSuite(name=suite_name))
+        print("Created new expectation suite")
+
+    _cache[key] = (batch_def, suite)
+    return batch_def, suite
+
+def update_suite(asset_name, batch_def, suite):
+    # Replace the cached suite after it has been saved as a new object
+    _cache[(suite.name, asset_name)] = (batch_def, suite)
+
+def referenced_columns(suite):
+    # Sorted columns named by the suite's expectations, or None when every
+    # column has to be read: an empty suite, a table-level expectation, or a
+    # row_condition, which may refer to any column
+    columns = set()
+    for e in suite.expectations:
+        kwargs = e.configuration.kwargs
+        if kwargs.get("row_condition"):
+            return None
+        if "column" in kwargs:
+            columns.add(kwargs["column"])
+        elif "column_A" in kwargs and "column_B" in kwargs:
+            columns.update((kwargs["column_A"], kwargs["column_B"]))
+        elif "column_list" in kwargs:
+            columns.update(kwargs["column_list"])
+        else:
+            return None
+    return sorted(columns) or None
@@ -0,0 +1,37 @@
+import runpy
+from concurrent.futures import ProcessPoolExecutor
+from _context import get as get_context
+from _setup import get_or_build as get_or_build_setup
+
+# Script file and the entry point it defines
+SCRIPTS = [
+    ("01_hello_world.py", "hello_world"),
+    ("02_csv_validation.py", "validate_csv"),
+    ("03_parquet_validation.py", "validate_parquet"),
+]
+
+def _run(script):
+    path, entry_point = script
+    runpy.run_path(path)[entry_point]()
+
+def main():
+    # Adding a datasource, asset or batch definition rewrites
+    # great_expectations.yml, which is not safe from several processes at
+    # once. Create whatever is missing here, one script at a time, so the
+    # workers only read the config.
+    context = get_context()
+    for path, _ in SCRIPTS:
+        names = runpy.run_path(path)
+        get_or_build_setup(
+            context,
+            names["DATASOURCE_NAME"],
+            names["ASSET_NAME"],
+            names["BATCH_DEFINITION_NAME"],
+            names["SUITE_NAME"]
+        )
+
+    with ProcessPoolExecutor(max_workers=len(SCRIPTS)) as ex:
+        list(ex.map(_run, SCRIPTS))
+
+if __name__ == "__main__":
+    main()